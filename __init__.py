@@ -1,2 +1,12 @@
-from .app import App
-from .tab import Tab
+__all__ = ["App", "Tab"]
+
+
+def __getattr__(name):
+    # Resolve lazily so a bare `import easyui` doesn't load tkinter
+    if name == "App":
+        from .app import App
+        return App
+    if name == "Tab":
+        from .tab import Tab
+        return Tab
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,14 +1,24 @@
-import tkinter as tk
-from tkinter import ttk
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from tkinter import ttk
+
+
+def _get_tk():
+    """Import tkinter on first use; importing the package alone stays cheap."""
+    import tkinter as tk
+    from tkinter import ttk
+    return tk, ttk
 
 
 class App:
     def __init__(self, title: str = "EasyUI", size=(900, 500)):
+        tk, ttk = _get_tk()
         self.root = tk.Tk()
         self.root.title(title)
         self.root.geometry(f"{size[0]}x{size[1]}")
 
-        self.notebook = ttk.Notebook(self.root)
+        self.notebook: "ttk.Notebook" = ttk.Notebook(self.root)
         self.notebook.pack(fill="both", expand=True)
 
     def add_tab(self, tab):
@@ -3,6 +3,21 @@ from .label import Label
 from .input import Input
 from .button import Button
 
+# type name -> factory(spec) building the element; extend via register_element()
+_ELEMENT_FACTORIES = {
+    "input": lambda s: Input(s.get("label"), s.get("default", "")),
+    "button": lambda s: Button(s.get("label"), s.get("on_click")),
+    "label": lambda s: Label(s.get("label")),
+}
+
+
+def register_element(name, factory):
+    """
+    Make a custom element type usable in Section.add_row_elements.
+    factory: callable taking the spec dict and returning a BaseElement.
+    """
+    _ELEMENT_FACTORIES[name] = factory
+
 class Section:
     def __init__(self, title=None):
         self.title = title
@@ -35,16 +50,11 @@ class Section:
         {'type': 'input', 'label': 'Username', 'default': 'abc', 'on_click': func}
         """
         row = []
+        factories = _ELEMENT_FACTORIES
         for spec in element_specs:
-            t = spec.get("type")
-            if t == "input":
-                el = Input(spec.get("label"), spec.get("default", ""))
-            elif t == "button":
-                el = Button(spec.get("label"), spec.get("on_click"))
-            elif t == "label":
-                el = Label(spec.get("label"))
-            else:
+            factory = factories.get(spec.get("type"))
+            if factory is None:
                 continue
-            row.append(el)
+            row.append(factory(spec))
         self.rows.append(row)
         return row
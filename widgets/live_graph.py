@@ -1,16 +1,66 @@
 # easyui/widgets/live_graph.py
 from __future__ import annotations
 
+import queue
+import statistics
+import threading
 import time
+from collections import deque
+from itertools import islice
+from operator import itemgetter
 import tkinter as tk
+from tkinter import font as tkfont
 from tkinter import ttk
-from typing import Callable, Dict, List, Optional, Union
+from typing import Callable, Deque, Dict, List, Optional, Union
 
 Number = Union[int, float]
 
 # Minimal but nice-looking palette (no external libs)
 _SERIES_COLORS = ["#00D1B2", "#FF6B6B", "#FFD93D", "#6BCBFF", "#B28DFF", "#A3E635"]
 
+# Trailing-edge debounce for <Configure> resize storms
+_RESIZE_DEBOUNCE_MS = 40
+
+# How often to check whether a stopped worker has left its last sampler call
+_WORKER_POLL_MS = 50
+
+# Keep at most this many lines in the sample log
+_LOG_MAX_LINES = 500
+
+# Refresh the achieved-rate readout every N ticks
+_STATUS_EVERY = 30
+
+
+def _decimate_minmax(pts, buckets: int) -> List[tuple[float, float]]:
+    """
+    Reduce time-ordered (t, y) samples to the min and max of each of `buckets`
+    equal-count buckets (kept in time order), so peaks survive decimation.
+    The first and last samples are always kept.
+    """
+    n = len(pts)
+    step = -(-n // buckets)
+    by_y = itemgetter(1)
+    out: List[tuple[float, float]] = []
+    it = iter(pts)
+    while True:
+        bucket = list(islice(it, step))
+        if not bucket:
+            break
+        lo = min(bucket, key=by_y)
+        hi = max(bucket, key=by_y)
+        if lo is hi:
+            out.append(lo)
+        elif lo[0] <= hi[0]:
+            out += (lo, hi)
+        else:
+            out += (hi, lo)
+    first, last = pts[0], pts[-1]
+    if out[0] is not first:
+        out.insert(0, first)
+    if out[-1] is not last:
+        out.append(last)
+    return out
+
 
 class LiveGraph:
     """
@@ -19,6 +69,11 @@ class LiveGraph:
     - Axes + grid + labels
     - Multiple series (dict name->value) or single number if series has length 1
     - Start/Stop, optional "Sample once" button
+
+    While running, `sampler` is called on a background thread, not the Tk thread.
+    It must not touch Tk objects (widgets, StringVar/IOField values, ...): read
+    plain Python state instead, or copy what you need on the Tk thread beforehand.
+    "Sample once" calls it on the Tk thread and is disabled while running.
     """
 
     def __init__(
@@ -41,6 +96,7 @@ class LiveGraph:
         self.interval_ms = int(interval_ms)
         self.sampler = sampler
         self.series = list(series)
+        self._series_colors = [_SERIES_COLORS[i % len(_SERIES_COLORS)] for i in range(len(self.series))]
         self.max_points = int(max_points)
         self.window_seconds = float(window_seconds)
         self.y_padding = float(y_padding)
@@ -50,8 +106,43 @@ class LiveGraph:
         self._running = False
         self._after_id: Optional[str] = None
 
-        # data: name -> list[(t, y)]
-        self.data: Dict[str, List[tuple[float, float]]] = {name: [] for name in self.series}
+        # sampler runs on a worker thread; the Tk thread only drains the queue
+        self._q: "queue.Queue[tuple[float, object]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._stop_event: Optional[threading.Event] = None
+        self._worker_poll: Optional[str] = None
+
+        # coalesced redraw: many requests between paints -> one redraw
+        self._dirty = False
+        self._draw_scheduled = False
+        self._flush_after: Optional[str] = None
+        self._resize_after: Optional[str] = None
+        self._stale = False  # samples arrived while hidden and weren't drawn
+
+        # tick lateness history (measured period - requested delay, seconds) used to
+        # shorten the next delay; redraw timestamps feed the fps readout
+        self._delays: Deque[float] = deque(maxlen=64)
+        self._last_tick: Optional[float] = None
+        self._last_delay = 0.0
+        self._draw_times: Deque[float] = deque(maxlen=_STATUS_EVERY + 1)
+
+        # canvas item cache: static items are rebuilt on resize, series items are moved
+        self._static_size: Optional[tuple[int, int]] = None
+        self._waiting: Optional[bool] = None
+        self._grid_ids: List[int] = []
+        self._label_ids: Dict[str, List[int]] = {"y": [], "x": []}
+        self._line_ids: Dict[str, int] = {}
+        self._marker_ids: Dict[str, int] = {}
+
+        # data: name -> deque[(t, y)] (maxlen enforces the hard cap)
+        self.data: Dict[str, Deque[tuple[float, float]]] = {
+            name: deque(maxlen=self.max_points) for name in self.series
+        }
+
+        # samples are stamped with a monotonic clock; labels map back to wall-clock time
+        self._t0_wall = time.time()
+        self._t0_mono = time.monotonic()
+        self._label_cache: Dict[int, str] = {}
 
         # smoothed y-range
         self._y_min: Optional[float] = None
@@ -66,10 +157,8 @@ class LiveGraph:
 
         ttk.Label(header, text=self.title).pack(side="left")
 
-        self.status = ttk.Label(
-            header,
-            text=f"window={self.window_seconds:g}s  interval={self.interval_ms}ms",
-        )
+        self._status_text = f"window={self.window_seconds:g}s  interval={self.interval_ms}ms"
+        self.status = ttk.Label(header, text=self._status_text)
         self.status.pack(side="left", padx=(12, 0))
 
         self.btn = ttk.Button(header, text="Start", command=self.toggle)
@@ -84,6 +173,12 @@ class LiveGraph:
         self.canvas = tk.Canvas(self.frame, height=height, highlightthickness=0)
         self.canvas.pack(fill="both", expand=True, pady=(10, 0))
 
+        # one shared font object for every canvas text item (resolved once, not per item)
+        self._font = tkfont.Font(root=self.canvas, font="TkDefaultFont")
+
+        # log lines are batched and written to the Text widget on the idle flush
+        self._log_pending: List[str] = []
+
         if self.show_log:
             self.log = tk.Text(self.frame, height=6)
             self.log.pack(fill="x", pady=(10, 0))
@@ -91,8 +186,14 @@ class LiveGraph:
         else:
             self.log = None
 
-        # redraw on resize
-        self.canvas.bind("<Configure>", lambda e: self.redraw())
+        # redraw on resize (debounced)
+        self.canvas.bind("<Configure>", self._on_configure)
+        # notebook tabs map/unmap the pane (our parent), not the canvas; <Map> fires on
+        # every platform, unlike <Visibility> (X11 only). add="+" keeps the parent's own bindings.
+        self._map_funcid = self.parent.bind("<Map>", self._on_parent_map, add="+")
+
+        # stop the sampler thread if the widget goes away without destroy()
+        self.frame.bind("<Destroy>", self._on_destroy)
 
     # ----------------- Controls -----------------
 
@@ -102,43 +203,190 @@ class LiveGraph:
         else:
             self.start()
 
+    def _worker_busy(self) -> bool:
+        return self._worker is not None and self._worker.is_alive()
+
     def start(self):
-        if self._running:
+        # A stopped worker may still be inside the sampler: never run two at once
+        if self._running or self._worker_busy():
             return
         self._running = True
         self.btn.configure(text="Stop")
+        if self.btn_once is not None:
+            self.btn_once.configure(state="disabled")
+
+        # leftovers from a previous run must not leak into this one
+        while True:
+            try:
+                self._q.get_nowait()
+            except queue.Empty:
+                break
+
+        self._last_tick = None  # don't count the paused time as lateness
+
+        self._stop_event = threading.Event()
+        self._worker = threading.Thread(
+            target=self._sample_loop, args=(self._stop_event,), daemon=True
+        )
+        self._worker.start()
         self._tick()
 
     def stop(self):
         self._running = False
-        self.btn.configure(text="Start")
+        if self._stop_event is not None:
+            self._stop_event.set()
+            self._stop_event = None
         if self._after_id is not None:
             try:
                 self.parent.after_cancel(self._after_id)
-            except Exception:
-                pass
+            except tk.TclError:
+                pass  # interpreter already torn down
             self._after_id = None
+        try:
+            self.btn.configure(text="Start")
+            self._await_worker_exit()
+        except tk.TclError:
+            pass  # button already destroyed
+
+    def _await_worker_exit(self):
+        """Keep Start / Sample once disabled until the old worker has returned."""
+        self._worker_poll = None
+        busy = self._worker_busy()
+        state = "disabled" if busy else "normal"
+        self.btn.configure(state=state)
+        if self.btn_once is not None:
+            self.btn_once.configure(state=state)
+        if busy:
+            self._worker_poll = self.canvas.after(_WORKER_POLL_MS, self._await_worker_exit)
+
+    def destroy(self):
+        """Stop sampling, cancel pending callbacks, release data and destroy the widget."""
+        self.stop()
+        self._cancel_timers()
+
+        self.canvas.unbind("<Configure>")
+        self._unbind_parent_map()
+        self.sampler = None
+        self.data.clear()
+        self.frame.destroy()
+
+    def _cancel_timers(self):
+        """Cancel the pending resize-debounce, idle-flush and worker-poll callbacks."""
+        for after_id in (self._resize_after, self._flush_after, self._worker_poll):
+            if after_id is not None:
+                try:
+                    self.canvas.after_cancel(after_id)
+                except tk.TclError:
+                    pass
+        self._resize_after = self._flush_after = self._worker_poll = None
+        self._draw_scheduled = False
+
+    def _unbind_parent_map(self):
+        """Remove only our <Map> handler from the parent (unbind() would drop them all)."""
+        funcid, self._map_funcid = self._map_funcid, None
+        if funcid is None:
+            return
+        try:
+            script = self.parent.bind("<Map>")
+            kept = "\n".join(line for line in script.split("\n") if funcid not in line)
+            self.parent.tk.call("bind", self.parent._w, "<Map>", kept)
+            self.parent.deletecommand(funcid)
+        except tk.TclError:
+            pass  # parent already destroyed
+
+    def _on_destroy(self, event):
+        # after/after_idle callbacks outlive the widget: drop them before they hit a dead canvas
+        if event.widget is self.frame:
+            self.stop()
+            self._cancel_timers()
+            self._unbind_parent_map()
 
     def sample_once(self):
         """Run the sampler once and redraw (does not start the periodic loop)."""
+        # The worker owns the sampler while it runs (including a call still in
+        # flight after stop()): never call it from two threads or interleave stamps.
+        if self._running or self._worker_busy():
+            return
+        self._drain()
         self._append_sample()
-        self.redraw()
+        self._request_redraw()
 
     # ----------------- Sampling -----------------
 
+    def _sample_loop(self, stop_event: threading.Event):
+        """Worker thread: call the sampler on a fixed cadence. Never touches Tk."""
+        interval = self.interval_ms / 1000.0
+        deadline = time.monotonic()
+        while not stop_event.is_set():
+            now = time.monotonic()
+            try:
+                result = self.sampler()
+            except Exception as exc:
+                # an error from a call that outlived stop() belongs to no run: drop it
+                if not stop_event.is_set():
+                    self._q.put((now, exc))
+                return
+            if stop_event.is_set():
+                return
+            self._q.put((now, result))
+
+            # Fixed cadence measured from the deadline, not from when the sampler returned
+            deadline += interval
+            delay = deadline - time.monotonic()
+            if delay < 0:
+                # fell behind: skip missed slots instead of bursting
+                deadline = time.monotonic()
+                delay = 0.0
+            stop_event.wait(delay)
+
+    def _drain(self) -> bool:
+        """Ingest all queued samples (Tk thread). Returns True if anything arrived."""
+        got = False
+        while True:
+            try:
+                now, result = self._q.get_nowait()
+            except queue.Empty:
+                return got
+            if isinstance(result, Exception):
+                self.stop()
+                raise result
+            try:
+                self._ingest(now, result)
+            except Exception:
+                # bad sampler output: don't leave the worker running with nobody draining
+                self.stop()
+                raise
+            got = True
+
     def _tick(self):
         if not self._running:
             return
 
-        self._append_sample()
-        self.redraw()
+        t0 = time.perf_counter()
+        # How much later than requested did this tick fire (idle redraws, other events, ...)
+        if self._last_tick is not None:
+            self._delays.append((t0 - self._last_tick) - self._last_delay)
+        self._last_tick = t0
+
+        # Keep ingesting while hidden (e.g. another notebook tab), but only paint when viewable;
+        # the parent's <Map> triggers one catch-up redraw when the graph is shown again.
+        if self._drain():
+            if self.canvas.winfo_viewable():
+                self._request_redraw()
+            else:
+                self._stale = True
 
-        self._after_id = self.parent.after(self.interval_ms, self._tick)
+        # Subtract the predicted lateness so the tick-to-tick period approaches interval_ms
+        pred = statistics.median(self._delays) if self._delays else 0.0
+        next_ms = max(1, int(self.interval_ms - pred * 1000))
+        self._last_delay = next_ms / 1000.0
+        self._after_id = self.parent.after(next_ms, self._tick)
 
     def _append_sample(self):
-        now = time.time()
-        result = self.sampler()
+        now = time.monotonic()
+        self._ingest(now, self.sampler())
 
+    def _ingest(self, now: float, result):
         # Allow number for single-series shortcut
         if isinstance(result, (int, float)):
             if len(self.series) != 1:
@@ -154,31 +402,86 @@ class LiveGraph:
                 continue
             y = float(result[name])
             self.data[name].append((now, y))
-
-            # hard cap
-            if len(self.data[name]) > self.max_points:
-                self.data[name] = self.data[name][-self.max_points :]
-
             line_parts.append(f"{name}={y:.3f}")
 
-        # Auto-scroll (time window)
+        # Auto-scroll (time window): samples are time-ordered, so only pop the expired head
         cutoff = now - self.window_seconds
         for name in self.series:
-            self.data[name] = [(t, y) for (t, y) in self.data[name] if t >= cutoff]
+            dq = self.data[name]
+            while dq and dq[0][0] < cutoff:
+                dq.popleft()
 
         if self.log is not None and line_parts:
-            self._log(f"{time.strftime('%H:%M:%S')}  " + "  ".join(line_parts))
+            stamp = time.strftime("%H:%M:%S", time.localtime(now + self._t0_wall - self._t0_mono))
+            self._log(f"{stamp}  " + "  ".join(line_parts))
 
     def _log(self, msg: str):
         if self.log is None:
             return
+        self._log_pending.append(msg)
+        self._schedule_flush()
+
+    def _flush_log(self):
+        if self.log is None or not self._log_pending:
+            return
         self.log.configure(state="normal")
-        self.log.insert("end", msg + "\n")
+        self.log.insert("end", "\n".join(self._log_pending) + "\n")
+        self._log_pending.clear()
+
+        # ring semantics: drop the oldest lines past the cap
+        n = int(self.log.index("end-1c").split(".")[0])
+        if n > _LOG_MAX_LINES:
+            self.log.delete("1.0", f"{n - _LOG_MAX_LINES}.0")
+
         self.log.see("end")
         self.log.configure(state="disabled")
 
     # ----------------- Drawing -----------------
 
+    def _on_parent_map(self, event=None):
+        if event is not None and event.widget is not self.parent:
+            return
+        if self._stale:
+            self._stale = False
+            self._request_redraw()
+
+    def _on_configure(self, event=None):
+        # Restart the timer on every event so a drag produces one redraw once it settles
+        if self._resize_after is not None:
+            self.canvas.after_cancel(self._resize_after)
+        self._resize_after = self.canvas.after(_RESIZE_DEBOUNCE_MS, self._do_resize)
+
+    def _do_resize(self):
+        self._resize_after = None
+        self._request_redraw()
+
+    def _request_redraw(self):
+        """Mark the graph dirty; the actual redraw runs once when Tk is idle."""
+        self._dirty = True
+        self._schedule_flush()
+
+    def _schedule_flush(self):
+        if not self._draw_scheduled:
+            self._draw_scheduled = True
+            self._flush_after = self.canvas.after_idle(self._flush_redraw)
+
+    def _flush_redraw(self):
+        dirty = self._dirty
+        self._dirty = False
+        self._draw_scheduled = False
+        self._flush_after = None
+        if dirty:
+            self._stale = False
+            self.redraw()
+
+            # fps readout counts actual redraws, not ticks
+            self._draw_times.append(time.perf_counter())
+            if len(self._draw_times) > _STATUS_EVERY:
+                fps = _STATUS_EVERY / max(1e-9, self._draw_times[-1] - self._draw_times[0])
+                self.status.configure(text=f"{self._status_text}  ~{fps:.1f} fps")
+                self._draw_times.clear()
+        self._flush_log()
+
     def redraw(self):
         w = max(10, self.canvas.winfo_width())
         h = max(10, self.canvas.winfo_height())
@@ -187,29 +490,40 @@ class LiveGraph:
         pad_top = 16
         pad_bottom = 44
 
-        self.canvas.delete("all")
+        x0 = pad_left
+        x1 = w - pad_right
+        y0 = pad_top
+        y1 = h - pad_bottom
+
+        # Frame, grid, labels and legend only depend on the canvas size
+        if self._static_size != (w, h):
+            self._build_static(w, h, pad_left, pad_top, pad_right, pad_bottom)
 
-        # Collect points within window
-        all_points: List[tuple[float, float]] = []
+        # Window bounds per series. Each deque is time-ordered, so the time range
+        # comes from its ends; y uses builtin min/max over the deque (no temp list).
+        by_y = itemgetter(1)
+        n_points = 0
+        t_min = t_max = raw_min = raw_max = 0.0
         for name in self.series:
-            all_points.extend(self.data.get(name, []))
-
-        if len(all_points) < 2:
-            # draw empty frame
-            self._draw_frame(w, h, pad_left, pad_top, pad_right, pad_bottom)
-            self.canvas.create_text(
-                w // 2,
-                h // 2,
-                text="Waiting for data…",
-                fill="#777",
-            )
+            pts = self.data.get(name)
+            if not pts:
+                continue
+            lo = min(pts, key=by_y)[1]
+            hi = max(pts, key=by_y)[1]
+            if n_points == 0:
+                t_min, t_max, raw_min, raw_max = pts[0][0], pts[-1][0], lo, hi
+            else:
+                t_min = min(t_min, pts[0][0])
+                t_max = max(t_max, pts[-1][0])
+                raw_min = min(raw_min, lo)
+                raw_max = max(raw_max, hi)
+            n_points += len(pts)
+
+        if n_points < 2:
+            # show empty frame
+            self._set_waiting(True)
             return
-
-        t_min = min(t for t, _ in all_points)
-        t_max = max(t for t, _ in all_points)
-
-        raw_min = min(y for _, y in all_points)
-        raw_max = max(y for _, y in all_points)
+        self._set_waiting(False)
 
         # Smooth Y scaling (optional)
         if self._y_min is None or self._y_max is None:
@@ -238,81 +552,127 @@ class LiveGraph:
         if y_max == y_min:
             y_max = y_min + 1.0
 
-        x0 = pad_left
-        x1 = w - pad_right
-        y0 = pad_top
-        y1 = h - pad_bottom
-
-        def x_of(t: float) -> float:
-            return x0 + (t - t_min) / (t_max - t_min) * (x1 - x0)
-
-        def y_of(y: float) -> float:
-            return y1 - (y - y_min) / (y_max - y_min) * (y1 - y0)
+        # Affine data->canvas transform: x = ox + t*sx, y = oy + v*sy
+        sx = (x1 - x0) / (t_max - t_min)
+        ox = x0 - t_min * sx
+        sy = -(y1 - y0) / (y_max - y_min)
+        oy = y1 - y_min * sy
 
-        # Background + border
-        self._draw_frame(w, h, pad_left, pad_top, pad_right, pad_bottom)
-
-        # Grid + axis labels
-        self._draw_grid_and_labels(
-            x0, x1, y0, y1, t_min, t_max, y_min, y_max,
-            w, h, pad_left, pad_bottom
-        )
+        # Axis labels (text only; items already exist)
+        self._update_labels(t_min, t_max, y_min, y_max)
 
-        # Plot each series
+        # Plot each series: move existing items instead of recreating them
+        canvas = self.canvas
+        set_coords = canvas.coords
+        columns = max(2, int(x1 - x0))
         for idx, name in enumerate(self.series):
             pts = self.data.get(name, [])
+            line_id = self._line_ids.get(name)
+            marker_id = self._marker_ids.get(name)
             if len(pts) < 2:
+                if line_id is not None:
+                    canvas.itemconfigure(line_id, state="hidden")
+                    canvas.itemconfigure(marker_id, state="hidden")
                 continue
 
-            coords = []
-            for t, y in pts:
-                coords.extend([x_of(t), y_of(y)])
+            # More points than pixels is wasted work: keep min+max per pixel column
+            if len(pts) > 2 * columns:
+                pts = _decimate_minmax(pts, columns)
 
-            color = _SERIES_COLORS[idx % len(_SERIES_COLORS)]
-            self.canvas.create_line(*coords, width=2, fill=color)
+            # Fill x/y slots by slice assignment: no per-point 2-tuples
+            coords = [0.0] * (2 * len(pts))
+            coords[0::2] = [ox + t * sx for t, _ in pts]
+            coords[1::2] = [oy + y * sy for _, y in pts]
 
-            # draw last value marker
+            # last value marker
             lx, ly = coords[-2], coords[-1]
-            self.canvas.create_oval(lx - 3, ly - 3, lx + 3, ly + 3, fill=color, outline="")
+
+            if line_id is None:
+                color = self._series_colors[idx]
+                self._line_ids[name] = canvas.create_line(
+                    *coords, width=2, fill=color, tags="series"
+                )
+                self._marker_ids[name] = canvas.create_oval(
+                    lx - 3, ly - 3, lx + 3, ly + 3, fill=color, outline="", tags="series"
+                )
+            else:
+                set_coords(line_id, *coords)
+                set_coords(marker_id, lx - 3, ly - 3, lx + 3, ly + 3)
+                canvas.itemconfigure(line_id, state="normal")
+                canvas.itemconfigure(marker_id, state="normal")
+
+    def _build_static(self, w, h, pad_left, pad_top, pad_right, pad_bottom):
+        """(Re)create the size-dependent items; series items are kept and raised above them."""
+        self.canvas.delete("static")
+        self._grid_ids = []
+        self._label_ids = {"y": [], "x": []}
+
+        x0 = pad_left
+        x1 = w - pad_right
+        y0 = pad_top
+        y1 = h - pad_bottom
+
+        # Background + border
+        self._draw_frame(w, h, pad_left, pad_top, pad_right, pad_bottom)
+
+        # Grid + axis labels
+        self._draw_grid_and_labels(x0, x1, y0, y1, w, h, pad_left, pad_bottom)
 
         # Legend (top-right)
         self._draw_legend(x1, y0)
 
+        self.canvas.create_text(
+            w // 2,
+            h // 2,
+            text="Waiting for data…",
+            fill="#777",
+            font=self._font,
+            tags=("static", "waiting"),
+        )
+
+        self.canvas.tag_lower("static")
+        self._static_size = (w, h)
+        self._waiting = None
+
+    def _set_waiting(self, waiting: bool):
+        if self._waiting == waiting:
+            return
+        self._waiting = waiting
+        shown, hidden = ("waiting", "axes") if waiting else ("axes", "waiting")
+        self.canvas.itemconfigure(shown, state="normal")
+        self.canvas.itemconfigure(hidden, state="hidden")
+        if waiting:
+            self.canvas.itemconfigure("series", state="hidden")
+
     def _draw_frame(self, w, h, pad_left, pad_top, pad_right, pad_bottom):
         x0 = pad_left
         x1 = w - pad_right
         y0 = pad_top
         y1 = h - pad_bottom
         # Background
-        self.canvas.create_rectangle(x0, y0, x1, y1, fill="#111111", outline="#444444")
+        self.canvas.create_rectangle(
+            x0, y0, x1, y1, fill="#111111", outline="#444444", tags="static"
+        )
 
-    def _draw_grid_and_labels(
-        self,
-        x0, x1, y0, y1,
-        t_min, t_max,
-        y_min, y_max,
-        w, h,
-        pad_left, pad_bottom
-    ):
-        # Y grid lines (5)
+    def _draw_grid_and_labels(self, x0, x1, y0, y1, w, h, pad_left, pad_bottom):
+        tags = ("static", "axes")
+
+        # Y grid lines (5); label text is filled in by _update_labels
         for i in range(5):
             frac = i / 4
-            yv = y_min + frac * (y_max - y_min)
             y = y1 - frac * (y1 - y0)
-            self.canvas.create_line(x0, y, x1, y, fill="#2A2A2A")
-            self.canvas.create_text(6, y, anchor="w", fill="#AAAAAA", text=f"{yv:.2f}")
+            self._grid_ids.append(self.canvas.create_line(x0, y, x1, y, fill="#2A2A2A", tags=tags))
+            self._label_ids["y"].append(
+                self.canvas.create_text(6, y, anchor="w", fill="#AAAAAA", font=self._font, tags=tags)
+            )
 
         # X grid lines (5) + time labels as wall-clock timestamps within the window
-        window = max(1e-6, (t_max - t_min))
         for i in range(5):
             frac = i / 4
-            tv = t_min + frac * window           # actual time value at this tick mark
             x = x0 + frac * (x1 - x0)
 
-            self.canvas.create_line(x, y0, x, y1, fill="#2A2A2A")
-
+            self._grid_ids.append(self.canvas.create_line(x, y0, x, y1, fill="#2A2A2A", tags=tags))
 
-            label = time.strftime("%H:%M:%S", time.localtime(tv))
             if i == 0:
                 anchor = "nw"   # text grows right
             elif i == 4:
@@ -320,24 +680,46 @@ class LiveGraph:
             else:
                 anchor = "n"
 
-            self.canvas.create_text(
-                x,
-                h - pad_bottom + 4,
-                anchor=anchor,
-                fill="#AAAAAA",
-                text=label
+            self._label_ids["x"].append(
+                self.canvas.create_text(
+                    x,
+                    h - pad_bottom + 4,
+                    anchor=anchor,
+                    fill="#AAAAAA",
+                    font=self._font,
+                    tags=tags,
+                )
             )
 
         # Axis titles (light)
-        self.canvas.create_text(pad_left, 2, anchor="nw", fill="#AAAAAA", text="Value")
-        self.canvas.create_text(w // 2, h - 2, anchor="s", fill="#AAAAAA", text="Time")
+        self.canvas.create_text(pad_left, 2, anchor="nw", fill="#AAAAAA", text="Value", font=self._font, tags=tags)
+        self.canvas.create_text(w // 2, h - 2, anchor="s", fill="#AAAAAA", text="Time", font=self._font, tags=tags)
+
+    def _update_labels(self, t_min, t_max, y_min, y_max):
+        for i, item in enumerate(self._label_ids["y"]):
+            yv = y_min + (i / 4) * (y_max - y_min)
+            self.canvas.itemconfigure(item, text=f"{yv:.2f}")
+
+        window = max(1e-6, (t_max - t_min))
+        wall_offset = self._t0_wall - self._t0_mono
+        cache = self._label_cache
+        if len(cache) > 128:
+            cache.clear()
+        for i, item in enumerate(self._label_ids["x"]):
+            tv = t_min + (i / 4) * window           # actual time value at this tick mark
+            sec = int(tv + wall_offset)
+            label = cache.get(sec)
+            if label is None:
+                label = cache[sec] = time.strftime("%H:%M:%S", time.localtime(sec))
+            self.canvas.itemconfigure(item, text=label)
 
     def _draw_legend(self, x1, y0):
         # Simple legend at top-right inside plot box
+        tags = ("static", "axes")
         x = x1 - 6
         y = y0 + 6
         for idx, name in enumerate(self.series):
-            color = _SERIES_COLORS[idx % len(_SERIES_COLORS)]
-            self.canvas.create_rectangle(x - 90, y, x - 76, y + 10, fill=color, outline="")
-            self.canvas.create_text(x - 72, y + 5, anchor="w", fill="#DDDDDD", text=name)
+            color = self._series_colors[idx]
+            self.canvas.create_rectangle(x - 90, y, x - 76, y + 10, fill=color, outline="", tags=tags)
+            self.canvas.create_text(x - 72, y + 5, anchor="w", fill="#DDDDDD", text=name, font=self._font, tags=tags)
             y += 14